@@ -49,7 +49,7 @@ class CollectionRequestHandler(project.RequestHandlerMixin,
      LEFT JOIN v1.project_facts AS b
             ON b.fact_type_id = a.id
            AND b.project_id = %(project_id)s
-         WHERE (SELECT id FROM project_type_id) = ANY(a.project_type_ids)
+         WHERE a.project_type_ids @> ARRAY[(SELECT id FROM project_type_id)]
         ORDER BY a.name""")
 
     POST_SQL = re.sub(r'\s+', ' ', """\
@@ -70,6 +70,8 @@ class CollectionRequestHandler(project.RequestHandlerMixin,
 
     async def post(self, *args, **kwargs):
         facts = await self._coerce_facts(self.get_request_body())
+        if not facts:
+            return self.set_status(204)
         for fact in facts:
             fact.update({
                 'project_id': kwargs['project_id'],
@@ -88,6 +90,8 @@ class CollectionRequestHandler(project.RequestHandlerMixin,
         the coercion appropriately.
 
         """
+        if not facts:
+            return []
         result = await self.postgres_execute(
             'SELECT id, data_type'
             '  FROM v1.project_fact_types'
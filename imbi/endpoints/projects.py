@@ -1,7 +1,8 @@
-import asyncio
+import functools
 import re
+import typing
 
-from imbi import errors, models
+from imbi import errors
 from imbi.endpoints import base
 from imbi.opensearch import project
 
@@ -86,26 +87,29 @@ class CollectionRequestHandler(project.RequestHandlerMixin,
                a.sentry_project_slug,
                a.sonarqube_project_key,
                a.pagerduty_service_id,
-               v1.project_score(a.id) AS project_score
+               v1.project_score(a.id) AS project_score,
+               count(*) OVER () AS records
           FROM v1.projects AS a
           JOIN v1.namespaces AS b ON b.id = a.namespace_id
           JOIN v1.project_types AS c ON c.id = a.project_type_id
           {{WHERE}} {{ORDER_BY}} LIMIT %(limit)s OFFSET %(offset)s""")
 
     COUNT_SQL = re.sub(r'\s+', ' ', """\
-        SELECT count(a.*) AS records
+        SELECT count(*) AS records
           FROM v1.projects AS a
           JOIN v1.namespaces AS b ON b.id = a.namespace_id
           JOIN v1.project_types AS c ON c.id = a.project_type_id
           {{WHERE}}""")
 
     FILTER_CHUNKS = {
-        'name': 'to_tsvector(lower(a.name)) @@ websearch_to_tsquery(%(name)s)',
-        'namespace_id': 'b.id = %(namespace_id)s',
-        'project_type_id': 'c.id = %(project_type_id)s',
+        'name': ("to_tsvector('english', lower(a.name))"
+                 " @@ websearch_to_tsquery('english', %(name)s)"),
+        'namespace_id': 'a.namespace_id = %(namespace_id)s',
+        'project_type_id': 'a.project_type_id = %(project_type_id)s',
         'sonarqube_project_key':
             'a.sonarqube_project_key = %(sonarqube_project_key)s',
     }
+    _FILTER_ITEMS = tuple(FILTER_CHUNKS.items())
 
     SORT_MAP = {
         'project_score': 'project_score',
@@ -114,9 +118,7 @@ class CollectionRequestHandler(project.RequestHandlerMixin,
         'name': 'a.name'
     }
 
-    SORT_PATTERN = re.compile(
-        r'(?:(?P<column>name|namespace|project_score|project_type) '
-        r'(?P<direction>asc|desc))')
+    SORT_PATTERN = re.compile(r'(?P<column>\w+) (?P<direction>asc|desc)')
 
     POST_SQL = re.sub(r'\s+', ' ', """\
         INSERT INTO v1.projects
@@ -132,39 +134,73 @@ class CollectionRequestHandler(project.RequestHandlerMixin,
         where_chunks = []
         if self.get_query_argument('include_archived', 'false') == 'false':
             where_chunks.append('a.archived IS FALSE')
-        for kwarg in self.FILTER_CHUNKS.keys():
+        for kwarg, chunk in self._FILTER_ITEMS:
             value = self.get_query_argument(kwarg, None)
             if value is not None:
                 kwargs[kwarg] = value
-                where_chunks.append(self.FILTER_CHUNKS[kwarg])
+                where_chunks.append(chunk)
         where_sql = ''
         if where_chunks:
             where_sql = ' WHERE {}'.format(' AND '.join(where_chunks))
-        sql = self.COLLECTION_SQL.replace('{{WHERE}}', where_sql)
-        count_sql = self.COUNT_SQL.replace('{{WHERE}}', where_sql)
-
-        order_sql = 'ORDER BY a.name ASC'
-        order_by_chunks = []
-        for match in self.SORT_PATTERN.finditer(
-                self.get_query_argument('sort', '')):
-            order_by_chunks.append(
-                f'{match.group("column")} {match.group("direction").upper()}')
-        if order_by_chunks:
-            order_sql = ' ORDER BY {}'.format(', '.join(order_by_chunks))
-        sql = sql.replace('{{ORDER_BY}}', order_sql)
-
-        count = await self.postgres_execute(
-            count_sql, kwargs, metric_name='count-{}'.format(self.NAME))
+        sql, count_sql = self._build_sql(
+            where_sql, self._order_by(self.get_query_argument('sort', '')))
+
         result = await self.postgres_execute(
             sql, kwargs, metric_name='get-{}'.format(self.NAME))
+        if result.rows:
+            records = result.rows[0]['records']
+        elif kwargs['offset'] or not kwargs['limit']:
+            # The windowed count is not available when paging past the
+            # last row or asking for an empty page, so fall back to
+            # counting explicitly
+            count = await self.postgres_execute(
+                count_sql, kwargs, metric_name='count-{}'.format(self.NAME))
+            records = count.row['records']
+        else:
+            records = 0
+        for row in result.rows:
+            del row['records']
         self.send_response({
-            'rows': count.row['records'],
+            'rows': records,
             'data': result.rows})
 
     async def post(self, *_args, **kwargs):
         result = await self._post(kwargs)
         await self.index_document(result['id'])
 
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_sql(cls, where_sql: str, order_sql: str) \
+            -> typing.Tuple[str, str]:
+        """Return the collection and count queries for the WHERE and
+        ORDER BY clauses, memoized in a bounded LRU cache so that repeated
+        filter and sort combinations skip the string assembly
+
+        """
+        sql = cls.COLLECTION_SQL.replace('{{WHERE}}', where_sql)
+        return (sql.replace('{{ORDER_BY}}', order_sql),
+                cls.COUNT_SQL.replace('{{WHERE}}', where_sql))
+
+    def _order_by(self, value: str) -> str:
+        """Build the ORDER BY clause for the comma delimited ``sort`` query
+        argument, ignoring any column that is not in :attr:`SORT_MAP` or
+        that was already specified
+
+        """
+        chunks, seen = [], set()
+        if value:
+            for token in value.split(','):
+                match = self.SORT_PATTERN.fullmatch(token.strip())
+                if not match:
+                    continue
+                column = match.group('column')
+                if column in self.SORT_MAP and column not in seen:
+                    seen.add(column)
+                    chunks.append('{} {}'.format(
+                        self.SORT_MAP[column],
+                        match.group('direction').upper()))
+        return 'ORDER BY {}'.format(', '.join(chunks or ['a.name ASC']))
+
 
 class RecordRequestHandler(project.RequestHandlerMixin,
                            _RequestHandlerMixin,
@@ -174,35 +210,6 @@ class RecordRequestHandler(project.RequestHandlerMixin,
 
     DELETE_SQL = 'DELETE FROM v1.projects WHERE id=%(id)s'
 
-    GET_FULL_SQL = re.sub(r'\s+', ' ', """\
-        SELECT a.id,
-               a.created_at,
-               a.created_by,
-               a.last_modified_at,
-               a.last_modified_by,
-               a.namespace_id,
-               b.name AS namespace,
-               b.slug AS namespace_slug,
-               b.icon_class AS namespace_icon,
-               a.project_type_id,
-               c.name AS project_type,
-               c.slug AS project_type_slug,
-               c.icon_class AS project_icon,
-               a.name,
-               a.slug,
-               a.description,
-               a.environments,
-               a.archived,
-               a.gitlab_project_id,
-               a.sentry_project_slug,
-               a.sonarqube_project_key,
-               a.pagerduty_service_id,
-               v1.project_score(a.id)
-          FROM v1.projects AS a
-          JOIN v1.namespaces AS b ON b.id = a.namespace_id
-          JOIN v1.project_types AS c ON c.id = a.project_type_id
-         WHERE a.id=%(id)s""")
-
     GET_FACTS_SQL = re.sub(r'\s+', ' ', """\
         WITH project_type_id AS (SELECT project_type_id AS id
                                    FROM v1.projects
@@ -225,11 +232,8 @@ class RecordRequestHandler(project.RequestHandlerMixin,
                a.fact_type,
                a.ui_options,
                CASE WHEN b.value IS NULL THEN 0
-                    ELSE CASE WHEN a.fact_type = 'enum' THEN (
-                                          SELECT score::NUMERIC(9,2)
-                                            FROM v1.project_fact_type_enums
-                                           WHERE fact_type_id = b.fact_type_id
-                                             AND value = b.value)
+                    ELSE CASE WHEN a.fact_type = 'enum'
+                                   THEN c.score::NUMERIC(9,2)
                               WHEN a.fact_type = 'range' THEN (
                                           SELECT score::NUMERIC(9,2)
                                             FROM v1.project_fact_type_ranges
@@ -241,18 +245,17 @@ class RecordRequestHandler(project.RequestHandlerMixin,
                               ELSE 0
                           END
                 END AS score,
-               CASE WHEN a.fact_type = 'enum' THEN (
-                              SELECT icon_class
-                                FROM v1.project_fact_type_enums
-                               WHERE fact_type_id = b.fact_type_id
-                                 AND value = b.value)
+               CASE WHEN a.fact_type = 'enum' THEN c.icon_class
                     ELSE NULL
                 END AS icon_class
           FROM v1.project_fact_types AS a
      LEFT JOIN v1.project_facts AS b
             ON b.fact_type_id = a.id
            AND b.project_id = %(id)s
-         WHERE (SELECT id FROM project_type_id) = ANY(a.project_type_ids)
+     LEFT JOIN v1.project_fact_type_enums AS c
+            ON c.fact_type_id = b.fact_type_id
+           AND c.value = b.value
+         WHERE a.project_type_ids @> ARRAY[(SELECT id FROM project_type_id)]
         ORDER BY a.name""")
 
     GET_LINKS_SQL = re.sub(r'\s+', ' ', """\
@@ -266,10 +269,43 @@ class RecordRequestHandler(project.RequestHandlerMixin,
          ORDER BY b.link_type""")
 
     GET_URLS_SQL = re.sub(r'\s+', ' ', """\
-        SELECT environment, url
+        SELECT json_object_agg(environment, url ORDER BY environment)
           FROM v1.project_urls
-         WHERE project_id=%(id)s
-         ORDER BY environment""")
+         WHERE project_id=%(id)s""")
+
+    GET_FULL_SQL = re.sub(r'\s+', ' ', f"""\
+        SELECT a.id,
+               a.created_at,
+               a.created_by,
+               a.last_modified_at,
+               a.last_modified_by,
+               a.namespace_id,
+               b.name AS namespace,
+               b.slug AS namespace_slug,
+               b.icon_class AS namespace_icon,
+               a.project_type_id,
+               c.name AS project_type,
+               c.slug AS project_type_slug,
+               c.icon_class AS project_icon,
+               a.name,
+               a.slug,
+               a.description,
+               a.environments,
+               a.archived,
+               a.gitlab_project_id,
+               a.sentry_project_slug,
+               a.sonarqube_project_key,
+               a.pagerduty_service_id,
+               v1.project_score(a.id),
+               (SELECT json_agg(f ORDER BY f.name)
+                  FROM ({GET_FACTS_SQL}) AS f) AS facts,
+               (SELECT json_agg(l ORDER BY l.title)
+                  FROM ({GET_LINKS_SQL}) AS l) AS links,
+               ({GET_URLS_SQL}) AS urls
+          FROM v1.projects AS a
+          JOIN v1.namespaces AS b ON b.id = a.namespace_id
+          JOIN v1.project_types AS c ON c.id = a.project_type_id
+         WHERE a.id=%(id)s""")
 
     PATCH_SQL = re.sub(r'\s+', ' ', """\
         UPDATE v1.projects
@@ -294,25 +330,18 @@ class RecordRequestHandler(project.RequestHandlerMixin,
 
     async def get(self, *args, **kwargs):
         if self.get_argument('full', 'false') == 'true':
-            query_args = self._get_query_kwargs(kwargs)
-            project, facts, links, urls = await asyncio.gather(
-                self.postgres_execute(
-                    self.GET_FULL_SQL, query_args, 'get-{}'.format(self.NAME)),
-                self.postgres_execute(
-                    self.GET_FACTS_SQL, query_args, 'get-project-facts'),
-                self.postgres_execute(
-                    self.GET_LINKS_SQL, query_args, 'get-project-links'),
-                self.postgres_execute(
-                    self.GET_URLS_SQL, query_args, 'get-project-urls'))
-
-            if not project.row_count or not project.row:
+            result = await self.postgres_execute(
+                self.GET_FULL_SQL, self._get_query_kwargs(kwargs),
+                'get-{}'.format(self.NAME))
+
+            if not result.row_count or not result.row:
                 raise errors.ItemNotFound()
 
-            output = project.row
+            output = result.row
             output.update({
-                'facts': facts.rows,
-                'links': links.rows,
-                'urls': {row['environment']: row['url'] for row in urls.rows}
+                'facts': output['facts'] or [],
+                'links': output['links'] or [],
+                'urls': output['urls'] or {}
             })
             self.send_response(output)
         else:
@@ -342,9 +371,7 @@ class SearchIndexRequestHandler(project.RequestHandlerMixin,
     async def get(self):
         result = await self.postgres_execute(self.SQL)
         ids = [row['id'] for row in result]
-        for project_id in ids:
-            value = await models.project(project_id, self.application)
-            await self.search_index.index_document(value)
+        await self.search_index.index_projects(ids)
 
         self.send_response({
             'status': 'ok',
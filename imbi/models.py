@@ -106,7 +106,7 @@ class ProjectFact:
      LEFT JOIN v1.project_facts AS b
             ON b.fact_type_id = a.id
            AND b.project_id = %(obj_id)s
-         WHERE (SELECT id FROM project_type_id) = ANY(a.project_type_ids)
+         WHERE a.project_type_ids @> ARRAY[(SELECT id FROM project_type_id)]
       ORDER BY a.name""")
 
     def __post_init__(self):
@@ -302,23 +302,26 @@ async def project(project_id: int,
             on_error=on_postgres_error) as conn:
         result = await conn.execute(
             Project.SQL, {'id': project_id}, 'project-model-load')
-        if result.row_count:
-            values = dict(result.row)
-            result = await asyncio.gather(
-                namespace(values['namespace_id'], application),
-                project_type(values['project_type_id'], application),
-                project_facts(project_id, application),
-                project_links(project_id, application),
-                project_urls(project_id, application))
-            del values['namespace_id']
-            del values['project_type_id']
-            values.update({
-                'namespace': result[0],
-                'project_type': result[1],
-                'facts': {value.name: value.value for value in result[2]},
-                'links': {value.link_type: value.url for value in result[3]},
-                'urls': {value.environment: value.url for value in result[4]}})
-            return Project(**values)
+
+    # The related objects are loaded after the connection is returned to
+    # the pool so that concurrent project loads can not starve it
+    if result.row_count:
+        values = dict(result.row)
+        result = await asyncio.gather(
+            namespace(values['namespace_id'], application),
+            project_type(values['project_type_id'], application),
+            project_facts(project_id, application),
+            project_links(project_id, application),
+            project_urls(project_id, application))
+        del values['namespace_id']
+        del values['project_type_id']
+        values.update({
+            'namespace': result[0],
+            'project_type': result[1],
+            'facts': {value.name: value.value for value in result[2]},
+            'links': {value.link_type: value.url for value in result[3]},
+            'urls': {value.environment: value.url for value in result[4]}})
+        return Project(**values)
 
 
 async def project_facts(project_id: int,
@@ -1,6 +1,7 @@
 import asyncio
 import dataclasses
 import logging
+import re
 import typing
 
 from imbi import errors, models
@@ -46,6 +47,22 @@ class ProjectIndex:
     """Class for interacting with the OpenSearch Project index"""
 
     INDEX = 'projects'
+    INDEX_CONCURRENCY = 4
+
+    # models.project loads the project and then gathers five related
+    # loads, each of which holds its own pooled connection
+    CONNECTIONS_PER_PROJECT = 5
+
+    MAPPINGS_SQL = re.sub(r'\s+', ' ', """\
+        SELECT 'facts' AS prefix, name, data_type::text AS data_type,
+               NULL::text AS es_type
+          FROM v1.project_fact_types
+         UNION ALL
+        SELECT 'links', link_type, NULL, 'text'
+          FROM v1.project_link_types
+         UNION ALL
+        SELECT 'urls', name, NULL, 'text'
+          FROM v1.environments""")
 
     def __init__(self, application: 'app.Application'):
         self.application = application
@@ -66,6 +83,35 @@ class ProjectIndex:
         await self.application.opensearch.index_document(
             self.INDEX, str(project.id), self._project_to_dict(project))
 
+    async def index_projects(self,
+                             project_ids: typing.Iterable[int]) -> None:
+        """Load and queue projects for indexing, loading at most
+        :attr:`INDEX_CONCURRENCY` projects at a time and no more than the
+        Postgres pool can serve at once
+
+        Each load can hold :attr:`CONNECTIONS_PER_PROJECT` connections, so
+        the concurrent loads may use the entire pool while a reindex runs.
+
+        """
+        semaphore = asyncio.Semaphore(self._index_concurrency())
+
+        async def index_project(project_id: int) -> None:
+            async with semaphore:
+                value = await models.project(project_id, self.application)
+                await self.index_document(value)
+
+        await asyncio.gather(*[index_project(project_id)
+                               for project_id in project_ids])
+
+    def _index_concurrency(self) -> int:
+        """Return how many projects can be loaded at once without asking
+        for more connections than the Postgres pool holds
+
+        """
+        pool_size = self.application._postgres_settings['max_pool_size']
+        return max(1, min(self.INDEX_CONCURRENCY,
+                          pool_size // self.CONNECTIONS_PER_PROJECT))
+
     async def search(self, query: str, max_results: int = 1000) \
             -> typing.Dict[str, typing.List[dict]]:
         return await self.application.opensearch.search(
@@ -108,22 +154,11 @@ class ProjectIndex:
         defn = dict(PROJECT)
         async with self.application.postgres_connector(
                 on_error=self._on_postgres_error) as cursor:
-            result = await cursor.execute(
-                        'SELECT name, data_type FROM v1.project_fact_types;')
-            for row in result:
-                defn[f'facts.{opensearch.sanitize_key(row["name"])}'] = {
-                    'type': FACT_DATA_TYPES[row['data_type']]
-                }
-            result = await cursor.execute(
-                        'SELECT link_type FROM v1.project_link_types;')
-            for row in result:
-                defn[f'links.{opensearch.sanitize_key(row["link_type"])}'] = {
-                    'type': 'text'
-                }
-            result = await cursor.execute('SELECT name FROM v1.environments;')
+            result = await cursor.execute(self.MAPPINGS_SQL)
             for row in result:
-                defn[f'urls.{opensearch.sanitize_key(row["name"])}'] = {
-                    'type': 'text'
+                key = opensearch.sanitize_key(row['name'])
+                defn[f'{row["prefix"]}.{key}'] = {
+                    'type': row['es_type'] or FACT_DATA_TYPES[row['data_type']]
                 }
         return defn
 
@@ -166,17 +201,14 @@ async def initialize(application: 'app.Application', build=False):
             result = await conn.execute(
                 'SELECT id FROM v1.projects ORDER BY id', {},
                 'build-project-index')
-            ids = [row['id'] for row in result]
-            LOGGER.info('Queueing %i projects for indexing', len(ids))
-            for project_id in ids:
-                value = await models.project(project_id, application)
-                await index.index_document(value)
-            LOGGER.info('Queued %i projects for indexing', len(ids))
-            while True:
-                pending = \
-                    await index.application.opensearch.documents_pending()
-                if not pending:
-                    break
-                LOGGER.info('Waiting for %i projects to index', pending)
-                await asyncio.sleep(2)
-            LOGGER.info('Indexing complete')
+        ids = [row['id'] for row in result]
+        LOGGER.info('Queueing %i projects for indexing', len(ids))
+        await index.index_projects(ids)
+        LOGGER.info('Queued %i projects for indexing', len(ids))
+        while True:
+            pending = await index.application.opensearch.documents_pending()
+            if not pending:
+                break
+            LOGGER.info('Waiting for %i projects to index', pending)
+            await asyncio.sleep(2)
+        LOGGER.info('Indexing complete')
@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import json
 import logging
@@ -42,6 +43,37 @@ class TestCase(testing.SprocketsHttpTestCase):
     INSERT INTO v1.authentication_tokens (token, name, username)
          VALUES (%(token)s, %(name)s, %(username)s);"""
 
+    SQL_INSERT_ENVIRONMENTS = """\
+    INSERT INTO v1.environments ("name", created_by, description, icon_class)
+         SELECT e."name", %(username)s, e.description, 'fas fa-blind'
+           FROM unnest(%(names)s::TEXT[], %(descriptions)s::TEXT[])
+                AS e("name", description)
+      RETURNING "name";"""
+
+    SQL_INSERT_NAMESPACE = """\
+    INSERT INTO v1.namespaces ("name", created_by, slug, icon_class)
+         VALUES (%(name)s, %(username)s, %(slug)s, 'fas fa-blind')
+      RETURNING *;"""
+
+    SQL_INSERT_PROJECT_FACT_TYPE_ENUM = """\
+    INSERT INTO v1.project_fact_type_enums
+                (fact_type_id, value, created_by, icon_class, score)
+         VALUES (%(fact_type_id)s, %(value)s, %(username)s, %(icon_class)s,
+                 %(score)s)
+      RETURNING *;"""
+
+    SQL_INSERT_PROJECT_LINK_TYPE = """\
+    INSERT INTO v1.project_link_types (link_type, created_by, icon_class)
+         VALUES (%(link_type)s, %(username)s, 'fas fa-blind')
+      RETURNING *;"""
+
+    SQL_INSERT_PROJECT_TYPE = """\
+    INSERT INTO v1.project_types ("name", created_by, plural_name, description,
+                                  slug, icon_class, environment_urls)
+         VALUES (%(name)s, %(username)s, %(plural_name)s, %(description)s,
+                 %(slug)s, 'fas fa-blind', FALSE)
+      RETURNING *;"""
+
     @classmethod
     def setUpClass(cls) -> None:
         cls.settings = read_config()
@@ -74,6 +106,32 @@ class TestCase(testing.SprocketsHttpTestCase):
         async with self.app.postgres_connector() as connector:
             return await connector.execute(sql, parameters)
 
+    def fetch_all(self,
+                  requests: typing.Iterable[typing.Tuple[str, dict]]) \
+            -> typing.List[httpclient.HTTPResponse]:
+        """Issue independent requests concurrently, returning the responses
+        in request order
+
+        """
+        async def gather():
+            return await asyncio.gather(*[
+                self.http_client.fetch(
+                    self.get_url(path), raise_error=False, **kwargs)
+                for path, kwargs in requests])
+        return self.io_loop.run_sync(gather)
+
+    def post_ok(self, path: str, body: typing.Any, code: int = 200) \
+            -> typing.Any:
+        """POST the JSON encoded body, assert the response status, and
+        return the decoded response body
+
+        """
+        result = self.fetch(path, method='POST', headers=self.headers,
+                            body=json.dumps(body).encode('utf-8'))
+        self.assertEqual(result.code, code, f'POST {path}')
+        if result.body:
+            return json.loads(result.body.decode('utf-8'))
+
     def get_app(self) -> app.Application:
         self.app = app.Application(**self.settings)
         return self.app
@@ -113,7 +171,7 @@ class TestCaseWithReset(TestCase):
 
     def setUp(self) -> None:
         super().setUp()
-        self.environments: typing.Optional[typing.List[typing.Dict]] = None
+        self.environments: typing.Optional[typing.List[str]] = None
         self.namespace: typing.Optional[typing.Dict] = None
         self.project_fact_type: typing.Optional[typing.Dict] = None
         self.project_type: typing.Optional[typing.Dict] = None
@@ -121,57 +179,49 @@ class TestCaseWithReset(TestCase):
             self.get_token())
 
     def tearDown(self) -> None:
-        for table in self.TRUNCATE_TABLES:
+        if self.TRUNCATE_TABLES:
+            tables = ', '.join(self.TRUNCATE_TABLES)
             self.run_until_complete(
-                self.postgres_execute(f'TRUNCATE TABLE {table} CASCADE', {}))
+                self.postgres_execute(f'TRUNCATE TABLE {tables} CASCADE', {}))
         super().tearDown()
 
-    def create_project(self) -> dict:
+    def create_project(self, **overrides) -> dict:
         if not self.environments:
             self.environments = self.create_environments()
         if not self.namespace:
             self.namespace = self.create_namespace()
         if not self.project_type:
             self.project_type = self.create_project_type()
-        result = self.fetch(
-            '/projects', method='POST', headers=self.headers,
-            body=json.dumps({
-                'namespace_id': self.namespace['id'],
-                'project_type_id': self.project_type['id'],
-                'name': str(uuid.uuid4()),
-                'slug': str(uuid.uuid4().hex),
-                'description': str(uuid.uuid4()),
-                'environments': self.environments,
-            }).encode('utf-8'))
-        self.assertEqual(result.code, 200)
-        return json.loads(result.body.decode('utf-8'))
-
-    def create_environments(self) -> typing.List[dict]:
-        environments = []
-        for iteration in range(0, 2):
-            result = self.fetch(
-                '/environments', method='POST', headers=self.headers,
-                body=json.dumps({
-                    'name': str(uuid.uuid4()),
-                    'description': str(uuid.uuid4()),
-                    'icon_class': 'fas fa-blind'
-                }).encode('utf-8'))
-            self.assertEqual(result.code, 200)
-            environments.append(
-                json.loads(result.body.decode('utf-8'))['name'])
-        return environments
+        project = {
+            'namespace_id': self.namespace['id'],
+            'project_type_id': self.project_type['id'],
+            'name': str(uuid.uuid4()),
+            'slug': str(uuid.uuid4().hex),
+            'description': str(uuid.uuid4()),
+            'environments': self.environments,
+        }
+        project.update(overrides)
+        return self.post_ok('/projects', project)
+
+    def create_environments(self) -> typing.List[str]:
+        """Create two environments with a single INSERT, returning their
+        names
+
+        """
+        result = self.run_until_complete(self.postgres_execute(
+            self.SQL_INSERT_ENVIRONMENTS, {
+                'names': [str(uuid.uuid4()) for _ in range(0, 2)],
+                'descriptions': [str(uuid.uuid4()) for _ in range(0, 2)],
+                'username': self.USERNAME[self.ADMIN_ACCESS]
+            }))
+        self.assertEqual(len(result), 2)
+        return [row['name'] for row in result]
 
     def create_namespace(self) -> dict:
-        namespace_name = str(uuid.uuid4())
-        result = self.fetch(
-            '/namespaces', method='POST', headers=self.headers,
-            body=json.dumps({
-                'name': namespace_name,
-                'slug': str(uuid.uuid4()),
-                'icon_class': 'fas fa-blind'
-            }).encode('utf-8'))
-        self.assertEqual(result.code, 200)
-        return json.loads(result.body.decode('utf-8'))
+        return self._insert_fixture(self.SQL_INSERT_NAMESPACE, {
+            'name': str(uuid.uuid4()),
+            'slug': str(uuid.uuid4())
+        })
 
     def create_project_fact_type(self, **overrides) -> dict:
         if not self.project_type:
@@ -184,34 +234,40 @@ class TestCaseWithReset(TestCase):
             'weight': 100
         }
         project_fact.update(overrides)
+        return self.post_ok('/project-fact-types', project_fact)
 
-        result = self.fetch(
-            '/project-fact-types', method='POST', headers=self.headers,
-            body=json.dumps(project_fact).encode('utf-8'))
-        self.assertEqual(result.code, 200)
-        return json.loads(result.body.decode('utf-8'))
+    def create_project_fact_type_enum(self, fact_type_id: int,
+                                      **overrides) -> dict:
+        values = {
+            'fact_type_id': fact_type_id,
+            'value': str(uuid.uuid4()),
+            'icon_class': 'fas fa-blind',
+            'score': 50
+        }
+        values.update(overrides)
+        return self._insert_fixture(
+            self.SQL_INSERT_PROJECT_FACT_TYPE_ENUM, values)
 
     def create_project_link_type(self) -> dict:
-        result = self.fetch(
-            '/project-link-types', method='POST', headers=self.headers,
-            body=json.dumps({
-                'link_type': str(uuid.uuid4()),
-                'icon_class': 'fas fa-blind'
-            }).encode('utf-8'))
-        self.assertEqual(result.code, 200)
-        return json.loads(result.body.decode('utf-8'))
+        return self._insert_fixture(self.SQL_INSERT_PROJECT_LINK_TYPE, {
+            'link_type': str(uuid.uuid4())
+        })
 
     def create_project_type(self) -> dict:
         project_type_name = str(uuid.uuid4())
-        result = self.fetch(
-            '/project-types', method='POST', headers=self.headers,
-            body=json.dumps({
-                'name': project_type_name,
-                'plural_name': '{}s'.format(project_type_name),
-                'slug': str(uuid.uuid4()),
-                'description': str(uuid.uuid4()),
-                'icon_class': 'fas fa-blind',
-                'environment_urls': False
-            }).encode('utf-8'))
-        self.assertEqual(result.code, 200)
-        return json.loads(result.body.decode('utf-8'))
+        return self._insert_fixture(self.SQL_INSERT_PROJECT_TYPE, {
+            'name': project_type_name,
+            'plural_name': '{}s'.format(project_type_name),
+            'slug': str(uuid.uuid4()),
+            'description': str(uuid.uuid4())
+        })
+
+    def _insert_fixture(self, sql: str, values: dict) -> dict:
+        """Insert a fixture row directly, bypassing the HTTP API, and
+        return it as a dict
+
+        """
+        values['username'] = self.USERNAME[self.ADMIN_ACCESS]
+        result = self.run_until_complete(self.postgres_execute(sql, values))
+        self.assertEqual(len(result), 1)
+        return dict(result.row)
@@ -1,6 +1,8 @@
+import datetime
 import json
 import uuid
 
+import iso8601
 import jsonpatch
 
 from imbi.endpoints import project_links, projects
@@ -12,6 +14,7 @@ class AsyncHTTPTestCase(base.TestCaseWithReset):
     ADMIN_ACCESS = True
     TRUNCATE_TABLES = [
         'v1.environments',
+        'v1.project_fact_types',
         'v1.project_link_types',
         'v1.project_types',
         'v1.namespaces'
@@ -403,6 +406,69 @@ class AsyncHTTPTestCase(base.TestCaseWithReset):
         result = self.fetch(url, headers=self.headers)
         self.assertEqual(result.code, 404)
 
+    def test_full_project(self):
+        project = self.create_project()
+        url = '/projects/{}?full=true'.format(project['id'])
+
+        # A project without facts, links, or URLs gets empty collections
+        result = self.fetch(url, headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertEqual(response['id'], project['id'])
+        self.assertEqual(response['namespace'], self.namespace['name'])
+        self.assertEqual(response['project_type'], self.project_type['name'])
+        self.assertListEqual(response['facts'], [])
+        self.assertListEqual(response['links'], [])
+        self.assertDictEqual(response['urls'], {})
+
+        fact_type = self.create_project_fact_type()
+        self.post_ok('/projects/{}/facts'.format(project['id']), [{
+            'fact_type_id': fact_type['id'],
+            'value': 'hello world'
+        }], 204)
+
+        self.post_ok('/projects/{}/links'.format(project['id']), {
+            'project_id': project['id'],
+            'link_type_id': self.project_link_type['id'],
+            'url': 'https://github.com/AWeber/Imbi'
+        })
+        self.post_ok('/projects/{}/urls'.format(project['id']), {
+            'project_id': project['id'],
+            'environment': self.environments[0],
+            'url': 'https://imbi.service.testing.consul'
+        })
+
+        result = self.fetch(url, headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertListEqual(response['links'], [{
+            'link_type_id': self.project_link_type['id'],
+            'title': self.project_link_type['link_type'],
+            'icon': self.project_link_type['icon_class'],
+            'url': 'https://github.com/AWeber/Imbi'
+        }])
+        self.assertDictEqual(response['urls'], {
+            self.environments[0]: 'https://imbi.service.testing.consul'
+        })
+
+        self.assertEqual(len(response['facts']), 1)
+        fact = response['facts'][0]
+        recorded_at = iso8601.parse_date(fact.pop('recorded_at'))
+        self.assertLess(
+            abs(datetime.datetime.now(datetime.timezone.utc) - recorded_at),
+            datetime.timedelta(minutes=5))
+        self.assertDictEqual(fact, {
+            'fact_type_id': fact_type['id'],
+            'name': fact_type['name'],
+            'recorded_by': self.USERNAME[self.ADMIN_ACCESS],
+            'value': 'hello world',
+            'data_type': 'string',
+            'fact_type': 'free-form',
+            'ui_options': fact_type['ui_options'],
+            'score': 0,
+            'icon_class': None
+        })
+
     def test_project_search(self):
         record = {
             'namespace_id': self.namespace['id'],
@@ -433,3 +499,70 @@ class AsyncHTTPTestCase(base.TestCaseWithReset):
                             headers=self.headers)
         self.assertTrue(in_results(proj_id,
                                    json.loads(result.body.decode('utf-8'))))
+
+    def test_project_sorting(self):
+        names = [self.create_project(name=f'{prefix}-{uuid.uuid4()}')['name']
+                 for prefix in ('a', 'b')]
+
+        result = self.fetch('/projects?sort=name%20desc', headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertEqual(response['rows'], 2)
+        self.assertListEqual([r['name'] for r in response['data']],
+                             list(reversed(names)))
+
+        # Repeated sort columns only use the first direction given
+        result = self.fetch('/projects?sort=name%20desc,name%20asc',
+                            headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertListEqual([r['name'] for r in response['data']],
+                             list(reversed(names)))
+
+        # Unknown sort columns fall back to the default ordering
+        result = self.fetch(
+            '/projects?sort=created_by%20desc', headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertListEqual([r['name'] for r in response['data']], names)
+
+    def test_project_paging(self):
+        for _iteration in range(0, 3):
+            self.create_project()
+
+        # The total comes from the windowed count on a partial page
+        result = self.fetch('/projects?limit=1', headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertEqual(response['rows'], 3)
+        self.assertEqual(len(response['data']), 1)
+        self.assertNotIn('records', response['data'][0])
+
+        # Paging past the last row falls back to the count query
+        result = self.fetch('/projects?offset=10', headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertEqual(response['rows'], 3)
+        self.assertListEqual(response['data'], [])
+
+        # An empty page still reports the total
+        result = self.fetch('/projects?limit=0', headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertEqual(response['rows'], 3)
+        self.assertListEqual(response['data'], [])
+
+        # No matching rows at all
+        result = self.fetch(f'/projects?name={uuid.uuid4().hex}',
+                            headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertEqual(response['rows'], 0)
+        self.assertListEqual(response['data'], [])
+
+        result = self.fetch('/projects', headers=self.headers)
+        self.assertEqual(result.code, 200)
+        response = json.loads(result.body.decode('utf-8'))
+        self.assertEqual(response['rows'], 3)
+        for row in response['data']:
+            self.assertNotIn('records', row)
@@ -2,6 +2,7 @@ import datetime
 import json
 import math
 import time
+import uuid
 
 from tests import base
 
@@ -9,11 +10,14 @@ from tests import base
 class ProjectFactTests(base.TestCaseWithReset):
     TRUNCATE_TABLES = ['v1.project_facts',
                        'v1.projects',
+                       'v1.project_fact_type_enums',
                        'v1.project_fact_types']
 
     def setUp(self) -> None:
         super().setUp()
         self.project = self.create_project()
+        self.project_url = f'/projects/{self.project["id"]}'
+        self.facts_url = f'{self.project_url}/facts'
 
     def test_valid_fact_values(self):
         now = datetime.datetime.now(datetime.timezone.utc)
@@ -31,15 +35,9 @@ class ProjectFactTests(base.TestCaseWithReset):
             {'fact_type_id': string_fact['id'], 'value': 'hello world'},
             {'fact_type_id': timestamp_fact['id'], 'value': now.isoformat()},
         ]
-        result = self.fetch(
-            f'/projects/{self.project["id"]}/facts',
-            method='POST',
-            body=json.dumps(facts).encode('utf-8'),
-            headers=self.headers)
-        self.assertEqual(204, result.code)
-
-        result = self.fetch(f'/projects/{self.project["id"]}/facts',
-                            headers=self.headers)
+        self.post_ok(self.facts_url, facts, 204)
+
+        result = self.fetch(self.facts_url, headers=self.headers)
         self.assertEqual(200, result.code)
 
         data = json.loads(result.body)
@@ -58,18 +56,14 @@ class ProjectFactTests(base.TestCaseWithReset):
         fact_type = self.create_project_fact_type(data_type=data_type)
         body = [{'fact_type_id': fact_type['id']}]
         for input_value, expected_value in values.items():
-            body[0]['value'] = input_value
-            result = self.fetch(
-                f'/projects/{self.project["id"]}/facts',
-                method='POST', body=json.dumps(body).encode('utf-8'),
-                headers=self.headers)
-            self.assertEqual(204, result.code, f'Failure for {input_value!r}')
-
-            result = self.fetch(f'/projects/{self.project["id"]}/facts',
-                                headers=self.headers)
-            self.assertEqual(200, result.code)
-            data = json.loads(result.body)
-            self.assertEqual(expected_value, data[0]['value'])
+            with self.subTest(input_value=input_value):
+                body[0]['value'] = input_value
+                self.post_ok(self.facts_url, body, 204)
+
+                result = self.fetch(self.facts_url, headers=self.headers)
+                self.assertEqual(200, result.code)
+                data = json.loads(result.body)
+                self.assertEqual(expected_value, data[0]['value'])
 
     def test_supported_boolean_formats(self):
         self.verify_expectations('boolean', {
@@ -156,69 +150,82 @@ class ProjectFactTests(base.TestCaseWithReset):
             {'fact_type_id': integer_fact['id'], 'value': {}},
             {'fact_type_id': decimal_fact['id'], 'value': 'not a number'},
         ]
-        for invalid_fact in invalid_facts:
-            result = self.fetch(
-                f'/projects/{self.project["id"]}/facts',
-                method='POST',
-                body=json.dumps([invalid_fact]).encode('utf-8'),
-                headers=self.headers)
+        results = self.fetch_all(
+            (self.facts_url, {
+                'method': 'POST',
+                'body': json.dumps([invalid_fact]).encode('utf-8'),
+                'headers': self.headers})
+            for invalid_fact in invalid_facts)
+        for invalid_fact, result in zip(invalid_facts, results):
             self.assertEqual(
                 400, result.code,
                 f'Unexpected response for {invalid_fact["value"]}')
 
-    def test_true_boolean_fact(self):
-        boolean_fact_type = self.create_project_fact_type(data_type='boolean')
-        result = self.fetch(
-            f'/projects/{self.project["id"]}/facts',
-            method='POST',
-            body=json.dumps([{
-                'fact_type_id': boolean_fact_type['id'],
-                'value': 'true'}]).encode('utf-8'),
-            headers=self.headers)
-        self.assertEqual(204, result.code)
-
-        result = self.fetch(f'/projects/{self.project["id"]}/facts',
-                            headers=self.headers)
-        self.assertEqual(200, result.code)
+    def assert_fact_scores(self, data_type: str, value: str,
+                           expected_score: int) -> None:
+        """Record a single fact and assert its score from both the facts
+        collection and the full project representation
+
+        """
+        fact_type = self.create_project_fact_type(data_type=data_type)
+        self.post_ok(self.facts_url, [{
+            'fact_type_id': fact_type['id'],
+            'value': value}], 204)
 
+        result = self.fetch(self.facts_url, headers=self.headers)
+        self.assertEqual(200, result.code)
         fact = json.loads(result.body)[0]
-        self.assertEqual(fact['score'], 100)
+        self.assertEqual(fact['score'], expected_score)
 
-        result = self.fetch(f'/projects/{self.project["id"]}?full=true',
+        result = self.fetch(f'{self.project_url}?full=true',
                             headers=self.headers)
         self.assertEqual(200, result.code)
-        project = json.loads(result.body)
-        fact = project['facts'][0]
-        self.assertEqual(fact['score'], 100)
+        fact = json.loads(result.body)['facts'][0]
+        self.assertEqual(fact['score'], expected_score)
+
+    def test_true_boolean_fact(self):
+        self.assert_fact_scores('boolean', 'true', 100)
 
     def test_false_boolean_fact(self):
-        boolean_fact_type = self.create_project_fact_type(data_type='boolean')
-        result = self.fetch(
-            f'/projects/{self.project["id"]}/facts',
-            method='POST',
-            body=json.dumps([{
-                'fact_type_id': boolean_fact_type['id'],
-                'value': 'false'}]).encode('utf-8'),
-            headers=self.headers)
-        self.assertEqual(204, result.code)
-
-        result = self.fetch(f'/projects/{self.project["id"]}/facts',
-                            headers=self.headers)
-        self.assertEqual(200, result.code)
+        self.assert_fact_scores('boolean', 'false', 0)
 
-        fact = json.loads(result.body)[0]
-        self.assertEqual(fact['score'], 0)
+    def test_enum_fact(self):
+        fact_type = self.create_project_fact_type(fact_type='enum')
+        option = self.create_project_fact_type_enum(
+            fact_type['id'], icon_class='fas fa-check', score=75)
+        self.post_ok(self.facts_url, [{
+            'fact_type_id': fact_type['id'],
+            'value': option['value']}], 204)
 
-        result = self.fetch(f'/projects/{self.project["id"]}?full=true',
+        result = self.fetch(f'{self.project_url}?full=true',
+                            headers=self.headers)
+        self.assertEqual(200, result.code)
+        fact = json.loads(result.body)['facts'][0]
+        self.assertEqual(fact['value'], option['value'])
+        self.assertEqual(fact['score'], 75)
+        self.assertEqual(fact['icon_class'], 'fas fa-check')
+
+        # A recorded value without a matching option scores nothing
+        self.run_until_complete(self.postgres_execute(
+            'UPDATE v1.project_fact_type_enums'
+            '   SET value = %(value)s'
+            ' WHERE id = %(id)s',
+            {'id': option['id'], 'value': str(uuid.uuid4())}))
+
+        result = self.fetch(f'{self.project_url}?full=true',
                             headers=self.headers)
         self.assertEqual(200, result.code)
-        project = json.loads(result.body)
-        fact = project['facts'][0]
+        fact = json.loads(result.body)['facts'][0]
+        self.assertEqual(fact['value'], option['value'])
         self.assertEqual(fact['score'], 0)
+        self.assertIsNone(fact['icon_class'])
 
     def test_unknown_fact_id(self):
-        result = self.fetch(f'/projects/{self.project["id"]}/facts',
+        result = self.fetch(self.facts_url,
                             method='POST',
                             body=b'[{"fact_type_id":-1,"value":""}]',
                             headers=self.headers)
         self.assertEqual(400, result.code)
+
+    def test_empty_fact_list(self):
+        self.post_ok(self.facts_url, [], 204)
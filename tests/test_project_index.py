@@ -0,0 +1,52 @@
+import asyncio
+import unittest.mock
+
+from imbi.opensearch import project
+
+
+class IndexProjectsTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.application = unittest.mock.Mock()
+        self.application._postgres_settings = {'max_pool_size': 100}
+        self.index = project.ProjectIndex(self.application)
+        self.active = 0
+        self.max_active = 0
+        self.indexed = []
+
+        async def load_project(project_id, _application):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return project_id
+
+        async def index_document(value):
+            self.indexed.append(value)
+
+        patcher = unittest.mock.patch.object(
+            project.models, 'project', side_effect=load_project)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.index.index_document = index_document
+
+    async def test_all_projects_are_indexed(self):
+        await self.index.index_projects(range(0, 20))
+        self.assertListEqual(sorted(self.indexed), list(range(0, 20)))
+
+    async def test_concurrency_is_limited(self):
+        await self.index.index_projects(range(0, 20))
+        self.assertEqual(self.max_active, self.index.INDEX_CONCURRENCY)
+
+    async def test_concurrency_fits_the_pool(self):
+        self.application._postgres_settings['max_pool_size'] = 10
+        await self.index.index_projects(range(0, 20))
+        self.assertEqual(self.max_active, 2)
+        self.assertListEqual(sorted(self.indexed), list(range(0, 20)))
+
+    async def test_small_pool_still_indexes(self):
+        self.application._postgres_settings['max_pool_size'] = 3
+        await self.index.index_projects(range(0, 5))
+        self.assertEqual(self.max_active, 1)
+        self.assertListEqual(sorted(self.indexed), list(range(0, 5)))